@@ -1,59 +1,90 @@
 # Simple To-Do List App
 
-tasks = []
+import sys
+
+# Tasks are stored column-wise: titles[i] is the name of task i, done[i] its 0/1 flag
+titles = []
+done = bytearray()
+
+# Status mark indexed by a done flag
+_STATUS = ("❌", "✅")
+
+def _ask(prompt):
+    """Prompt on stdout and read one line from stdin, bypassing input()'s readline hook."""
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip("\n")
+
+_MENU = (
+    "\n=== TO-DO LIST APP ===\n"
+    "1. View Tasks\n"
+    "2. Add Task\n"
+    "3. Remove Task\n"
+    "4. Mark Task as Done\n"
+    "5. Exit"
+)
 
 def show_menu():
-    print("\n=== TO-DO LIST APP ===")
-    print("1. View Tasks")
-    print("2. Add Task")
-    print("3. Remove Task")
-    print("4. Mark Task as Done")
-    print("5. Exit")
+    print(_MENU)
 
 def view_tasks():
-    if not tasks:
+    if not titles:
         print("No tasks yet!")
     else:
-        for i, task in enumerate(tasks, start=1):
-            status = "✅" if task["done"] else "❌"
-            print(f"{i}. {task['title']} [{status}]")
+        lines = [f"{i}. {title} [{_STATUS[is_done]}]" for i, (title, is_done) in enumerate(zip(titles, done), start=1)]
+        print("\n".join(lines))
 
 def add_task():
-    title = input("Enter task name: ")
-    tasks.append({"title": title, "done": False})
+    title = _ask("Enter task name: ")
+    titles.append(title)
+    done.append(0)
     print(f"Task '{title}' added!")
+    return True
 
 def remove_task():
     view_tasks()
     try:
-        task_num = int(input("Enter task number to remove: "))
-        removed = tasks.pop(task_num - 1)
-        print(f"Removed '{removed['title']}'")
+        idx = int(_ask("Enter task number to remove: ")) - 1
+        # list.pop(idx) shifts the tail, but the numbering shown to the user depends on order
+        removed = titles.pop(idx)
+        del done[idx]
+        print(f"Removed '{removed}'")
+        return True
     except (ValueError, IndexError):
         print("Invalid task number!")
 
 def mark_done():
     view_tasks()
     try:
-        task_num = int(input("Enter task number to mark done: "))
-        tasks[task_num - 1]["done"] = True
-        print(f"Marked '{tasks[task_num - 1]['title']}' as done!")
+        idx = int(_ask("Enter task number to mark done: ")) - 1
+        done[idx] = 1
+        print(f"Marked '{titles[idx]}' as done!")
+        return True
     except (ValueError, IndexError):
         print("Invalid task number!")
 
-# Main loop
+# Menu choice -> action; an action returns True when it changed the task list
+_ACTIONS = {
+    '1': view_tasks,
+    '2': add_task,
+    '3': remove_task,
+    '4': mark_done,
+}
+
+# Main loop: the menu is only reprinted after the task list changes
+_dirty = True
 while True:
-    show_menu()
-    choice = input("Enter choice: ")
-
-    if choice == '1':
-        view_tasks()
-    elif choice == '2':
-        add_task()
-    elif choice == '3':
-        remove_task()
-    elif choice == '4':
-        mark_done()
+    if _dirty:
+        show_menu()
+        _dirty = False
+    choice = _ask("Enter choice: ")
+
+    action = _ACTIONS.get(choice)
+    if action:
+        _dirty = bool(action())
     elif choice == '5':
         print("Goodbye 👋")
         break
@@ -8,12 +8,14 @@ root.geometry("400x500")
 root.resizable(False, False)
 
 tasks = []
+task_done = []  # done flag for each listbox row, kept in step with listbox_tasks
 
 # Functions
 def add_task():
     task = entry_task.get()
     if task != "":
         listbox_tasks.insert(tk.END, f"❌ {task}")
+        task_done.append(False)
         entry_task.delete(0, tk.END)
     else:
         messagebox.showwarning("Warning", "Please enter a task!")
@@ -22,18 +24,23 @@ def delete_task():
     try:
         selected_task = listbox_tasks.curselection()[0]
         listbox_tasks.delete(selected_task)
+        del task_done[selected_task]
     except IndexError:
         messagebox.showwarning("Warning", "Please select a task to delete!")
 
 def mark_done():
     try:
         selected_task = listbox_tasks.curselection()[0]
-        task_text = listbox_tasks.get(selected_task)
-        if task_text.startswith("✅"):
+        if task_done[selected_task]:
             messagebox.showinfo("Info", "Task already marked done!")
         else:
+            task_done[selected_task] = True
+            # Tk cannot edit a row's text in place, so the prefix swap needs delete + insert
+            task_text = listbox_tasks.get(selected_task)
             listbox_tasks.delete(selected_task)
-            listbox_tasks.insert(selected_task, task_text.replace("❌", "✅"))
+            listbox_tasks.insert(selected_task, "✅" + task_text[1:])
+            listbox_tasks.itemconfig(selected_task, foreground="#2a7")
+            listbox_tasks.selection_set(selected_task)
     except IndexError:
         messagebox.showwarning("Warning", "Please select a task to mark done!")
 
@@ -2,7 +2,7 @@
 """
 Tkinter Graphical Calculator
 - Single-file Python 3 app using tkinter
-- Safe expression evaluation using `ast` (no `eval` on raw input)
+- Safe expression evaluation: input is validated with `ast` before compiling (no `eval` on raw input)
 - Features: + - * / % ** parentheses, unary +/-, decimal numbers
 - Keyboard support, Clear (C), Backspace (⌫), Copy result
 - History panel (last 10 calculations)
@@ -11,8 +11,11 @@ Run: python tkinter_calculator.py
 """
 
 import ast
+import collections
+import functools
 import operator as op
 import math
+import re
 import tkinter as tk
 from tkinter import ttk
 from typing import Any
@@ -41,58 +44,174 @@ _ALLOWED_FUNCTIONS = {
     'round': round,
 }
 
+# Named constants allowed in expressions
+_CONSTANTS = {
+    'pi': math.pi,
+    'e': math.e,
+}
+
+# Characters typed on the keyboard that are inserted into the display
+_KEY_CHARS = frozenset('0123456789.+-*/()%')
+
+# A bare (optionally negative) number already in the form str(-value) would print:
+# no leading zeros and no trailing zeros after the decimal point
+_NUM_RE = re.compile(r'-?(0|[1-9]\d*)(\.\d*[1-9])?')
+
+# Characters an expression may contain; anything else is rejected before parsing
+_EXPR_RE = re.compile(r'[\s0-9+\-*/%().,_a-zA-Z]*')
+
+# Maximum number of evaluated expressions remembered by a Calculator
+_RESULT_CACHE_SIZE = 128
+
+
+# Namespace for compiled expressions: only the allowed functions and constants, no builtins.
+# _fold already reduces every valid expression to a single constant, so today nothing is
+# looked up here at eval time; the namespace only guards code that could survive folding.
+_SAFE_GLOBALS = {'__builtins__': {}, **_ALLOWED_FUNCTIONS, **_CONSTANTS}
+
+
+def _validate_expression(node):
+    _validate(node.body)
+
+
+def _validate_constant(node):
+    if not isinstance(node.value, (int, float)):
+        raise ValueError(f"Unsupported constant: {node.value}")
+
+
+def _validate_binop(node):
+    op_type = type(node.op)
+    if op_type not in _ALLOWED_OPERATORS:
+        raise ValueError(f"Unsupported binary operator: {op_type}")
+    _validate(node.left)
+    _validate(node.right)
+
+
+def _validate_unaryop(node):
+    op_type = type(node.op)
+    if op_type not in _ALLOWED_OPERATORS:
+        raise ValueError(f"Unsupported unary operator: {op_type}")
+    _validate(node.operand)
+
+
+def _validate_call(node):
+    if not (isinstance(node.func, ast.Name) and node.func.id in _ALLOWED_FUNCTIONS) or node.keywords:
+        raise ValueError("Unsupported function call")
+    for a in node.args:
+        _validate(a)
+
+
+def _validate_name(node):
+    # allow constants like 'pi' or 'e'
+    if node.id not in _CONSTANTS:
+        raise ValueError(f"Unsupported identifier: {node.id}")
+
+
+# Node type -> validator; exact-type lookup replaces an isinstance chain
+_VALIDATORS = {
+    ast.Expression: _validate_expression,
+    ast.Constant: _validate_constant,
+    ast.BinOp: _validate_binop,
+    ast.UnaryOp: _validate_unaryop,
+    ast.Call: _validate_call,
+    ast.Name: _validate_name,
+}
+
+
+def _validate(node):
+    """Reject any node outside the supported numeric subset. Raises ValueError."""
+    validator = _VALIDATORS.get(type(node))
+    if validator is None:
+        raise ValueError(f"Unsupported expression: {type(node)}")
+    validator(node)
+
+
+def _constant(value, node):
+    return ast.copy_location(ast.Constant(value), node)
+
+
+def _fold_expression(node):
+    node.body, _ = _fold(node.body)
+    return node, False
+
+
+def _fold_constant(node):
+    return node, True
+
+
+def _fold_name(node):
+    return _constant(_CONSTANTS[node.id], node), True
+
+
+def _fold_binop(node):
+    node.left, left_const = _fold(node.left)
+    node.right, right_const = _fold(node.right)
+    if left_const and right_const:
+        value = _ALLOWED_OPERATORS[type(node.op)](node.left.value, node.right.value)
+        return _constant(value, node), True
+    return node, False
+
+
+def _fold_unaryop(node):
+    node.operand, operand_const = _fold(node.operand)
+    if operand_const:
+        value = _ALLOWED_OPERATORS[type(node.op)](node.operand.value)
+        return _constant(value, node), True
+    return node, False
+
+
+def _fold_call(node):
+    folded = [_fold(a) for a in node.args]
+    node.args = [a for a, _ in folded]
+    if all(is_const for _, is_const in folded):
+        value = _ALLOWED_FUNCTIONS[node.func.id](*(a.value for a in node.args))
+        return _constant(value, node), True
+    return node, False
+
+
+# Node type -> folder, mirroring _VALIDATORS
+_FOLDERS = {
+    ast.Expression: _fold_expression,
+    ast.Constant: _fold_constant,
+    ast.Name: _fold_name,
+    ast.BinOp: _fold_binop,
+    ast.UnaryOp: _fold_unaryop,
+    ast.Call: _fold_call,
+}
+
+
+def _fold(node):
+    """Replace constant subtrees of a validated tree with their value.
+    Returns (node, is_const).
+    """
+    folder = _FOLDERS.get(type(node))
+    if folder is None:
+        raise ValueError(f"Unsupported expression: {type(node)}")
+    return folder(node)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile(expr: str):
+    """Parse, validate, fold and compile an expression once; repeated evaluations (history, Ans) reuse the code object."""
+    if not _EXPR_RE.fullmatch(expr):
+        raise ValueError("Unsupported characters in expression")
+    tree = ast.parse(expr, '<calc>', 'eval')
+    _validate(tree)
+    tree, _ = _fold(tree)
+    return compile(tree, '<calc>', 'eval')
+
 
 def safe_eval_expr(expr: str) -> Any:
     """Safely evaluate a numeric expression using ast.
     Supported: numbers, binary ops (+ - * / % **), unary +/-, parentheses, and a small set of functions.
+    The expression is validated against the allowed subset and constant-folded before it is
+    compiled, so only vetted code ever reaches `eval`. Since the grammar has no variables,
+    every valid expression folds to one constant and `eval` just returns it.
     Raises ValueError for unsupported expressions.
     """
-
-    def _eval(node):
-        if isinstance(node, ast.Expression):
-            return _eval(node.body)
-        elif isinstance(node, ast.Num):  # < Py3.8
-            return node.n
-        elif isinstance(node, ast.Constant):  # Py3.8+
-            if isinstance(node.value, (int, float)):
-                return node.value
-            else:
-                raise ValueError(f"Unsupported constant: {node.value}")
-        elif isinstance(node, ast.BinOp):
-            left = _eval(node.left)
-            right = _eval(node.right)
-            op_type = type(node.op)
-            if op_type in _ALLOWED_OPERATORS:
-                return _ALLOWED_OPERATORS[op_type](left, right)
-            raise ValueError(f"Unsupported binary operator: {op_type}")
-        elif isinstance(node, ast.UnaryOp):
-            operand = _eval(node.operand)
-            op_type = type(node.op)
-            if op_type in _ALLOWED_OPERATORS:
-                return _ALLOWED_OPERATORS[op_type](operand)
-            raise ValueError(f"Unsupported unary operator: {op_type}")
-        elif isinstance(node, ast.Call):
-            if isinstance(node.func, ast.Name):
-                func_name = node.func.id
-                if func_name in _ALLOWED_FUNCTIONS:
-                    args = [_eval(a) for a in node.args]
-                    return _ALLOWED_FUNCTIONS[func_name](*args)
-            raise ValueError("Unsupported function call")
-        elif isinstance(node, ast.Name):
-            # allow constants like 'pi' or 'e'
-            if node.id == 'pi':
-                return math.pi
-            if node.id == 'e':
-                return math.e
-            raise ValueError(f"Unsupported identifier: {node.id}")
-        elif isinstance(node, ast.Expr):
-            return _eval(node.value)
-        else:
-            raise ValueError(f"Unsupported expression: {type(node)}")
-
     try:
-        parsed = ast.parse(expr, mode='eval')
-        return _eval(parsed)
+        # globals double as locals, so any name left after folding resolves with a single lookup
+        return eval(_compile(expr), _SAFE_GLOBALS)
     except Exception as e:
         raise ValueError(f"Invalid expression: {e}")
 
@@ -132,20 +251,19 @@ class Calculator(tk.Tk):
         ]
 
         for (text, r, c) in btns:
-            cmd = (lambda t=text: self.on_button_click(t))
-            b = ttk.Button(buttons_frame, text=text, command=cmd, width=6)
+            b = ttk.Button(buttons_frame, text=text, command=functools.partial(self.on_button_click, text), width=6)
             b.grid(row=r, column=c, padx=2, pady=2)
 
         # Extra functions frame
         funcs_frame = ttk.Frame(self)
         funcs_frame.grid(row=0, column=1, rowspan=2, padx=(8, 0), sticky='n')
 
-        ttk.Button(funcs_frame, text='(', width=6, command=lambda: self.insert_text('(')).grid(row=0, column=0, pady=2)
-        ttk.Button(funcs_frame, text=')', width=6, command=lambda: self.insert_text(')')).grid(row=1, column=0, pady=2)
-        ttk.Button(funcs_frame, text='x²', width=6, command=lambda: self.insert_text('**2')).grid(row=2, column=0, pady=2)
-        ttk.Button(funcs_frame, text='x³', width=6, command=lambda: self.insert_text('**3')).grid(row=3, column=0, pady=2)
-        ttk.Button(funcs_frame, text='sqrt', width=6, command=lambda: self.insert_text('sqrt(')).grid(row=4, column=0, pady=2)
-        ttk.Button(funcs_frame, text='pi', width=6, command=lambda: self.insert_text('pi')).grid(row=5, column=0, pady=2)
+        ttk.Button(funcs_frame, text='(', width=6, command=functools.partial(self.insert_text, '(')).grid(row=0, column=0, pady=2)
+        ttk.Button(funcs_frame, text=')', width=6, command=functools.partial(self.insert_text, ')')).grid(row=1, column=0, pady=2)
+        ttk.Button(funcs_frame, text='x²', width=6, command=functools.partial(self.insert_text, '**2')).grid(row=2, column=0, pady=2)
+        ttk.Button(funcs_frame, text='x³', width=6, command=functools.partial(self.insert_text, '**3')).grid(row=3, column=0, pady=2)
+        ttk.Button(funcs_frame, text='sqrt', width=6, command=functools.partial(self.insert_text, 'sqrt(')).grid(row=4, column=0, pady=2)
+        ttk.Button(funcs_frame, text='pi', width=6, command=functools.partial(self.insert_text, 'pi')).grid(row=5, column=0, pady=2)
         ttk.Button(funcs_frame, text='Ans', width=6, command=self.insert_last_answer).grid(row=6, column=0, pady=2)
         ttk.Button(funcs_frame, text='Copy', width=6, command=self.copy_result).grid(row=7, column=0, pady=2)
 
@@ -157,15 +275,22 @@ class Calculator(tk.Tk):
         self.history_list.grid(row=1, column=0, sticky='ew')
         self.history_list.bind('<<ListboxSelect>>', self.on_history_select)
 
-        self.history = []  # store tuples (expr, result)
+        self.history = collections.deque(maxlen=50)  # store "expr = result" entries
         self.last_answer = ''
+        self._result_cache = collections.OrderedDict()  # expr -> formatted result
+        # pre-compile the named constants (pi, e) so evaluating them alone is a cache hit
+        for name in _CONSTANTS:
+            _compile(name)
 
         # Key bindings
         self.bind_all('<Return>', lambda e: self.evaluate())
         self.bind_all('<BackSpace>', lambda e: self.backspace())
         self.bind_all('<Escape>', lambda e: self.clear())
-        for key in '0123456789.+-*/()%':
-            self.bind_all(key, lambda e, k=key: self.insert_text(k))
+        self.bind_all('<Key>', self._on_key)
+
+    def _on_key(self, event):
+        if event.char in _KEY_CHARS:
+            self.insert_text(event.char)
 
     def insert_text(self, txt: str):
         if self.result_shown:
@@ -199,6 +324,8 @@ class Calculator(tk.Tk):
 
     def backspace(self):
         s = self.display_var.get()
+        if not s:
+            return
         pos = self.entry.index(tk.INSERT)
         if pos > 0:
             new = s[:pos-1] + s[pos:]
@@ -209,6 +336,12 @@ class Calculator(tk.Tk):
         s = self.display_var.get()
         if not s:
             return
+        if _NUM_RE.fullmatch(s):
+            # fast path: a single number needs no parsing; -0 is shown as 0 like the evaluated path
+            digits = s.lstrip('-')
+            self.display_var.set(digits if s.startswith('-') or digits == '0' else '-' + digits)
+            self.result_shown = True
+            return
         try:
             # Try to find last number and toggle its sign
             # we'll simply evaluate and negate if it's the whole expression
@@ -235,10 +368,17 @@ class Calculator(tk.Tk):
         if not expr:
             return
         try:
-            result = safe_eval_expr(expr)
-            # Format result: drop trailing .0 for ints
-            if isinstance(result, float) and result.is_integer():
-                result = int(result)
+            result = self._result_cache.get(expr)
+            if result is None:
+                result = safe_eval_expr(expr)
+                # Format result: drop trailing .0 for ints
+                if isinstance(result, float) and result.is_integer():
+                    result = int(result)
+                self._result_cache[expr] = result
+                if len(self._result_cache) > _RESULT_CACHE_SIZE:
+                    self._result_cache.popitem(last=False)
+            else:
+                self._result_cache.move_to_end(expr)
             self.display_var.set(str(result))
             self.result_shown = True
             # store history
@@ -250,16 +390,14 @@ class Calculator(tk.Tk):
 
     def _add_history(self, expr: str, result: str):
         entry = f"{expr} = {result}"
-        # avoid duplicates and keep max 50 entries
+        # avoid duplicates; the deque keeps max 50 entries
         if self.history and self.history[-1] == entry:
             return
         self.history.append(entry)
-        if len(self.history) > 50:
-            self.history.pop(0)
-        # update listbox with last 10
-        self.history_list.delete(0, tk.END)
-        for itm in reversed(self.history[-10:]):
-            self.history_list.insert(tk.END, itm)
+        # listbox shows the last 10, newest first
+        self.history_list.insert(0, entry)
+        if self.history_list.size() > 10:
+            self.history_list.delete(10)
 
     def on_history_select(self, event):
         sel = event.widget.curselection()